@@ -6,10 +6,19 @@
 ###################################################################################################
 
 from importlib.metadata import version
+from typing import TYPE_CHECKING, Any
 
-from configator.core import load_config
 from configator.log import configure_logging
-from configator.models import ConfigatorSettings, Environment, PostgresConfig, SentryConfig
+from configator.models import (
+    ConfigatorSettings,
+    Environment,
+    PostgresConfig,
+    PostgresSSLMode,
+    SentryConfig,
+)
+
+if TYPE_CHECKING:
+    from configator.core import load_config
 
 __maintainer__ = "kthy"
 __version__ = version("configator-op")
@@ -18,9 +27,20 @@ __all__ = [
     "ConfigatorSettings",
     "Environment",
     "PostgresConfig",
+    "PostgresSSLMode",
     "SentryConfig",
     "__maintainer__",
     "__version__",
     "configure_logging",
     "load_config",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import `load_config` on first access, deferring the 1Password SDK import (PEP 562)."""
+    if name == "load_config":
+        from configator.core import load_config
+
+        globals()[name] = load_config
+        return load_config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,10 +7,14 @@
 # License-Filename: LICENSE.md                                                                    #
 ###################################################################################################
 
-from functools import partial
+from asyncio import Task, create_task, gather
+from enum import IntEnum, auto, unique
+from functools import lru_cache
 from importlib.metadata import version
 from json import JSONDecodeError, loads
-from typing import Any
+from string import ascii_lowercase, ascii_uppercase
+from typing import Any, NamedTuple
+from weakref import WeakKeyDictionary
 
 from onepassword.client import Client as OnePasswordClient
 from onepassword.types import Item, ItemField, ItemOverview, VaultOverview
@@ -21,44 +25,104 @@ from .log import get_logger
 
 log = get_logger()
 
+_PKG_NAME = "configator_op"
+_PKG_VERSION = version(_PKG_NAME)
 
-async def load_config[T: BaseModel](*, token: str, vault: str, item: str, schema: type[T]) -> T:
-    """Return an initialized schema instance."""
-    log.debug("loading configuration into schema '%s'", schema.__name__)
+# Authenticated clients, keyed by service account token
+_CLIENTS: dict[str, OnePasswordClient] = {}
 
-    client = await _get_client(token)
+# Title-to-overview indexes per client, filled on first lookup and refreshed on a miss or when
+# load_config finds them stale
+_VAULTS: WeakKeyDictionary[OnePasswordClient, dict[str, VaultOverview]] = WeakKeyDictionary()
+_ITEMS: WeakKeyDictionary[OnePasswordClient, dict[str, dict[str, ItemOverview]]] = (
+    WeakKeyDictionary()
+)
 
-    vault_overview = await _get_vault_overview(client, vault)
-    if vault_overview is None:
-        raise RuntimeError(f"vault '{vault}' not found")
+_MAX_OP_LINK_DEPTH = 10
+
+# Maps ASCII field names to lower_snake_case in a single pass
+_SNAKE_CASE_TABLE = str.maketrans(ascii_uppercase + "-", ascii_lowercase + "_")
+
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+_TRUMPY = frozenset({"false", "0", "no", "off"})
 
-    item_overview = await _get_item_overview(client, vault_overview.id, item)
-    if item_overview is None:
-        raise RuntimeError(f"item '{item}' not found in vault {vault}")
 
-    cfg_item = await client.items.get(vault_id=vault_overview.id, item_id=item_overview.id)
+@unique
+class _Kind(IntEnum):
+    """How a field value is hydrated from 1Password."""
 
-    return await _hydrate_model(op_client=client, schema=schema, item=cfg_item)
+    MODEL = auto()
+    JSON = auto()
+    BOOL = auto()
+    SCALAR = auto()
 
 
-def _field_matcher(field: ItemField, *, title: str, section_id: str | None = None) -> bool:
-    """Return True if the given field matches the title and optional section ID."""
-    normalized_title = _op_field_name_to_lower_snake_case(field.title)
-    return normalized_title == title and (section_id is None or field.section_id == section_id)
+class _FieldSpec(NamedTuple):
+    """Precomputed metadata for hydrating a single schema field."""
+
+    key: str
+    cls: Any
+    default: Any
+    title: str
+    kind: _Kind
+
+
+async def load_config[T: BaseModel](
+    *, token: str, vault: str, item: str, schema: type[T], validate: bool = True
+) -> T:
+    """Return an initialized schema instance.
+
+    With `validate=False` the schema is built with `model_construct`, skipping Pydantic
+    validation and settings sources. Only use this when every field type in the schema is
+    produced exactly by the hydrator, e.g. no `Field` constraints or `ConfigatorSettings`.
+    """
+    log.debug("loading configuration into schema '%s'", schema.__name__)
+
+    client = await _get_client(token)
+    try:
+        cfg_item = await _get_item(client, vault, item)
+    except Exception:
+        # Cached overviews may be stale, e.g. if the vault or item was renamed or recreated
+        log.warning("failed to retrieve item '%s'; refreshing vault and item lists", item)
+        _VAULTS.pop(client, None)
+        _ITEMS.pop(client, None)
+        cfg_item = await _get_item(client, vault, item)
+
+    return await _hydrate_model(op_client=client, schema=schema, item=cfg_item, validate=validate)
 
 
 async def _get_client(token: str) -> OnePasswordClient:
-    """Initialize 1Password client."""
-    pkg_name = "configator_op"
-    pkg_version = version(pkg_name)
-    log.debug("instantiating 1Password client (%s-%s)", pkg_name, pkg_version)
-    op_client = await OnePasswordClient.authenticate(
-        auth=token,
-        integration_name=pkg_name,
-        integration_version=pkg_version,
-    )
-    log.debug("1Password client authenticated")
-    return op_client
+    """Return 1Password client for the given token, authenticating only on first use."""
+    client = _CLIENTS.get(token)
+    if client is None:
+        log.debug("instantiating 1Password client (%s-%s)", _PKG_NAME, _PKG_VERSION)
+        client = await OnePasswordClient.authenticate(
+            auth=token,
+            integration_name=_PKG_NAME,
+            integration_version=_PKG_VERSION,
+        )
+        log.debug("1Password client authenticated")
+        # No lock, as it would be bound to a single event loop; concurrent first calls may
+        # both authenticate, but they all get the client that was cached first
+        client = _CLIENTS.setdefault(token, client)
+    return client
+
+
+async def _get_item(op_client: OnePasswordClient, vault: str, item: str) -> Item:
+    """Retrieve item by vault and item titles."""
+    vault_overview = await _get_vault_overview(op_client, vault)
+    if vault_overview is None:
+        raise RuntimeError(f"vault '{vault}' not found")
+
+    item_overview = await _get_item_overview(op_client, vault_overview.id, item)
+    if item_overview is None:
+        raise RuntimeError(f"item '{item}' not found in vault {vault}")
+
+    cfg_item = await op_client.items.get(vault_id=vault_overview.id, item_id=item_overview.id)
+    if cfg_item.title != item or cfg_item.vault_id != vault_overview.id:
+        # A cached overview can point at an item that has since been renamed or moved
+        raise RuntimeError(f"item '{item}' not found in vault {vault}")
+    return cfg_item
 
 
 async def _get_item_overview(
@@ -66,12 +130,16 @@ async def _get_item_overview(
 ) -> ItemOverview | None:
     """Retrieve item overview."""
     log.debug("retrieving item '%s' from vault '%s'", item_name, vault_id)
-    available_items = await op_client.items.list(vault_id=vault_id)
-    for item in available_items:
-        if item.title == item_name:
-            return item
-    log.warning("item '%s' not found in vault '%s'", item_name, vault_id)
-    return None
+    vault_items = _ITEMS.setdefault(op_client, {})
+    items = vault_items.get(vault_id)
+    if items is None or item_name not in items:
+        items = vault_items[vault_id] = _index_by_title(
+            await op_client.items.list(vault_id=vault_id)
+        )
+    item = items.get(item_name)
+    if item is None:
+        log.warning("item '%s' not found in vault '%s'", item_name, vault_id)
+    return item
 
 
 def _get_sections(item: Item) -> dict[str, str]:
@@ -84,91 +152,197 @@ async def _get_vault_overview(
 ) -> VaultOverview | None:
     """Retrieve vault overview."""
     log.debug("retrieving vault '%s'", vault_name)
-    available_vaults = await op_client.vaults.list()
-    for vault in available_vaults:
-        if vault.title == vault_name:
-            return vault
-    log.warning("vault '%s' not found", vault_name)
-    return None
+    vaults = _VAULTS.get(op_client)
+    if vaults is None or vault_name not in vaults:
+        vaults = _VAULTS[op_client] = _index_by_title(await op_client.vaults.list())
+    vault = vaults.get(vault_name)
+    if vault is None:
+        log.warning("vault '%s' not found", vault_name)
+    return vault
+
+
+def _cancel_resolutions(resolved: dict[str, Task[str]]) -> None:
+    """Cancel pending op:// resolutions and retrieve the errors of failed ones."""
+    for task in resolved.values():
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            # Marks the error as retrieved, as the first failure is what gets raised
+            task.exception()
+
+
+@lru_cache(maxsize=None)
+def _field_specs(schema: type[BaseModel]) -> tuple[_FieldSpec, ...]:
+    """Return hydration metadata for the annotated fields of a schema."""
+    specs = []
+    for key, field_info in schema.model_fields.items():
+        cls = field_info.annotation
+        if cls is None:
+            log.warning("no annotation for field '%s'; skipping", key)
+            continue
+        specs.append(_FieldSpec(key, cls, field_info.default, key.lower(), _kind(cls)))
+    return tuple(specs)
 
 
 async def _hydrate_field(
     *,
     op_client: OnePasswordClient,
-    cls: type,
+    spec: _FieldSpec,
     item: Item,
-    key: str,
-    default: Any,
+    field_index: dict[tuple[str, str | None], ItemField],
+    resolved: dict[str, Task[str]],
     section_id: str | None = None,
+    validate: bool = True,
 ) -> Any:
     """Hydrate single field from 1Password item."""
-    wet_fields = item.fields
-    if issubclass(cls, BaseModel):
+    key, cls, default, title, kind = spec
+    log.debug("hydrating field '%s'", key)
+    if kind is _Kind.MODEL:
         sections = _get_sections(item)
         return await _hydrate_model(
-            op_client=op_client, schema=cls, item=item, section_id=sections[key.lower()]
+            op_client=op_client,
+            schema=cls,
+            item=item,
+            field_index=field_index,
+            resolved=resolved,
+            section_id=sections[title],
+            validate=validate,
         )
     else:
-        matcher = partial(_field_matcher, title=key.lower(), section_id=section_id)
-        ret_val = default
+        field = field_index.get((title, section_id))
+        if field is None:
+            if default is PydanticUndefined:
+                log.error("field '%s' not found and no default value provided", key)
+                raise RuntimeError(f"field '{key}' not found and no default value provided")
+            log.debug("using default value for field '%s'", key)
+            # model_construct would share the default instance, so leave the default to it
+            return default if validate else PydanticUndefined
         try:
-            str_val = await _resolve_op_link(op_client, next(filter(matcher, wet_fields)).value)
-            if issubclass(cls, (dict, list, set, tuple)):
+            str_val = await _resolve_op_link_cached(op_client, field.value, resolved)
+            if kind is _Kind.JSON:
                 ret_val = cls(loads(str_val))
-            elif issubclass(cls, bool):
+            elif kind is _Kind.BOOL:
                 ret_val = _parse_bool(str_val)
             else:
-                ret_val = cls(str_val)  # type: ignore[call-arg]
+                ret_val = cls(str_val)
         except JSONDecodeError as jde:
             log.error("failed to parse field '%s' as JSON: %s", key, str(jde))
             raise
-        except StopIteration:
-            if default is PydanticUndefined:
-                log.error("field '%s' not found and no default value provided", key)
-                raise
-            log.debug("using default value for field '%s'", key)
         return ret_val
 
 
+def _index_fields(item: Item) -> dict[tuple[str, str | None], ItemField]:
+    """Return mapping of normalized field titles and section IDs to item fields.
+
+    Every field is also indexed without a section ID, so that root-level fields can be found
+    in any section. The first field wins if several normalize to the same title.
+    """
+    field_index: dict[tuple[str, str | None], ItemField] = {}
+    for field in item.fields:
+        title = _op_field_name_to_lower_snake_case(field.title)
+        field_index.setdefault((title, field.section_id), field)
+        field_index.setdefault((title, None), field)
+    return field_index
+
+
+def _index_by_title[O: (ItemOverview, VaultOverview)](overviews: list[O]) -> dict[str, O]:
+    """Return mapping of titles to overviews, keeping the first one for duplicate titles."""
+    index: dict[str, O] = {}
+    for overview in overviews:
+        index.setdefault(overview.title, overview)
+    return index
+
+
 async def _hydrate_model[T: BaseModel](
-    *, op_client: OnePasswordClient, schema: type[T], item: Item, section_id: str | None = None
+    *,
+    op_client: OnePasswordClient,
+    schema: type[T],
+    item: Item,
+    field_index: dict[tuple[str, str | None], ItemField] | None = None,
+    resolved: dict[str, Task[str]] | None = None,
+    section_id: str | None = None,
+    validate: bool = True,
 ) -> T:
     """Hydrate Pydantic model from 1Password item."""
     log.debug("hydrating model '%s'", schema.__name__)
-    dry_model = schema.model_fields
-    wet_model: dict[str, Any] = {}
-    for key in dry_model:
-        log.debug("hydrating field '%s'", key)
-        cls = dry_model[key].annotation
-        if cls is None:
-            log.warning("no annotation for field '%s'; skipping", key)
-            continue
-
-        wet_model[key] = await _hydrate_field(
-            op_client=op_client,
-            cls=cls,
-            item=item,
-            key=key,
-            default=dry_model[key].default,
-            section_id=section_id,
+    specs = _field_specs(schema)
+    if field_index is None:
+        field_index = _index_fields(item)
+    owns_resolved = resolved is None
+    if resolved is None:
+        resolved = {}
+
+    # Fields are independent of each other, so resolve them concurrently to avoid paying one
+    # 1Password round-trip per field in sequence.
+    tasks = [
+        create_task(
+            _hydrate_field(
+                op_client=op_client,
+                spec=spec,
+                item=item,
+                field_index=field_index,
+                resolved=resolved,
+                section_id=section_id,
+                validate=validate,
+            )
         )
-
-    return schema(**wet_model)
-
-
+        for spec in specs
+    ]
+    try:
+        results = await gather(*tasks)
+    except BaseException:
+        # gather leaves the other fields running, so stop them and, once at the top level, any
+        # op:// resolutions still in flight instead of leaving them unowned
+        for task in tasks:
+            task.cancel()
+        if owns_resolved:
+            _cancel_resolutions(resolved)
+        raise
+    wet_model: dict[str, Any] = {
+        spec.key: result
+        for spec, result in zip(specs, results, strict=True)
+        if result is not PydanticUndefined
+    }
+
+    if validate:
+        return schema(**wet_model)
+    return schema.model_construct(**wet_model)
+
+
+def _kind(cls: Any) -> _Kind:
+    """Classify a field annotation by how its value is hydrated."""
+    try:
+        if issubclass(cls, BaseModel):
+            return _Kind.MODEL
+        if issubclass(cls, (dict, list, set, tuple)):
+            return _Kind.JSON
+        if issubclass(cls, bool):
+            return _Kind.BOOL
+    except TypeError:
+        # Not a class, e.g. a union or parametrized generic
+        pass
+    return _Kind.SCALAR
+
+
+@lru_cache(maxsize=4096)
 def _op_field_name_to_lower_snake_case(name: str) -> str:
     """Convert 1Password field name to lower_snake_case."""
+    if name.isascii():
+        return name.translate(_SNAKE_CASE_TABLE)
     return name.replace("-", "_").lower()
 
 
 def _parse_bool(str_val: str) -> bool:
     """Parse boolean value from string."""
-    truthy = {"true", "1", "yes", "on"}
-    trumpy = {"false", "0", "no", "off"}
+    # Try the value verbatim first, since it is usually already in canonical form
+    if str_val in _TRUTHY:
+        return True
+    elif str_val in _TRUMPY:
+        return False
     val_lower = str_val.strip().lower()
-    if val_lower in truthy:
+    if val_lower in _TRUTHY:
         return True
-    elif val_lower in trumpy:
+    elif val_lower in _TRUMPY:
         return False
     else:
         raise ValueError(f"cannot parse '{str_val}' as boolean")
@@ -176,15 +350,26 @@ def _parse_bool(str_val: str) -> bool:
 
 async def _resolve_op_link(op_client: OnePasswordClient, link: str) -> str:
     """Resolve op:// reference to its actual value."""
-    # This counter is used to guard against circular op:// references
-    moria_level = 0
-    while link.startswith("op://"):
+    # The depth is bounded to guard against circular op:// references
+    for _ in range(_MAX_OP_LINK_DEPTH):
+        if not link.startswith("op://"):
+            return link
         try:
             link = await op_client.secrets.resolve(link)
         except Exception as exc:
             raise RuntimeError(f"failed to resolve secret reference '{link}'") from exc
-        moria_level += 1
-        if moria_level > 9:
-            log.error("too many nested op:// references when resolving '%s'", link)
-            raise RuntimeError("the dwarves delved too greedily and too deep")
+    if link.startswith("op://"):
+        log.error("too many nested op:// references when resolving '%s'", link)
+        raise RuntimeError("the dwarves delved too greedily and too deep")
     return link
+
+
+async def _resolve_op_link_cached(
+    op_client: OnePasswordClient, link: str, resolved: dict[str, Task[str]]
+) -> str:
+    """Resolve op:// reference, reusing earlier or in-flight resolutions of the same link."""
+    if not link.startswith("op://"):
+        return link
+    if link not in resolved:
+        resolved[link] = create_task(_resolve_op_link(op_client, link))
+    return await resolved[link]
@@ -1,6 +1,8 @@
 """Logging configuration and setup module.
 
 This allows library users to inject their custom log config by calling log.configure_logging().
+Call it before loading any configuration: the module loggers are lazy proxies that are resolved,
+and then cached, on their first use.
 """
 
 ###################################################################################################
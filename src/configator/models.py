@@ -30,7 +30,7 @@ class ConfigatorSettings(BaseSettings):
     <https://docs.pydantic.dev/latest/concepts/pydantic_settings/#customise-settings-sources>
     """
 
-    model_config = SettingsConfigDict(use_enum_values=True)
+    model_config = SettingsConfigDict(defer_build=True, use_enum_values=True)
 
     @classmethod
     def settings_customise_sources(
@@ -59,7 +59,7 @@ class Environment(StrEnum):
 
 
 @unique
-class _PostgresSSLMode(StrEnum):
+class PostgresSSLMode(StrEnum):
     DISABLE = "disable"
     ALLOW = "allow"
     PREFER = "prefer"
@@ -76,7 +76,7 @@ class PostgresConfig(ConfigatorSettings):
     PGUSER: str = "postgres"
     PGPASSWORD: SecretStr = SecretStr("hunter2")
     PGDATABASE: str = "postgres"
-    PGSSLMODE: _PostgresSSLMode = _PostgresSSLMode("prefer")
+    PGSSLMODE: PostgresSSLMode = PostgresSSLMode.PREFER
     SCHEME: str = "postgresql"
 
     def dsn(self) -> PostgresDsn:
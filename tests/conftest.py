@@ -0,0 +1,67 @@
+"""Shared fixtures for the Configator test suite."""
+
+from inspect import isawaitable
+from types import SimpleNamespace
+from unittest.mock import call
+
+from pytest import fixture
+
+
+class FakeMethod:
+    """Async stand-in for a 1Password SDK method that records its calls.
+
+    Mirrors the parts of `AsyncMock` the tests use: `return_value`, `side_effect` (a callable,
+    an iterable of return values, or an exception) and the recorded `calls`.
+    """
+
+    def __init__(self):
+        self.return_value = None
+        self.calls = []
+        self._side_effect = None
+
+    @property
+    def call_count(self):
+        return len(self.calls)
+
+    @property
+    def side_effect(self):
+        return self._side_effect
+
+    @side_effect.setter
+    def side_effect(self, effect):
+        if effect is not None and not _is_exception(effect) and not callable(effect):
+            effect = iter(effect)
+        self._side_effect = effect
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append(call(*args, **kwargs))
+        effect = self._side_effect
+        if effect is None:
+            return self.return_value
+        if _is_exception(effect):
+            raise effect
+        if callable(effect):
+            result = effect(*args, **kwargs)
+            return await result if isawaitable(result) else result
+        return next(effect)
+
+
+class FakeOP:
+    """Fake 1Password client exposing the SDK methods used by Configator."""
+
+    def __init__(self):
+        self.items = SimpleNamespace(get=FakeMethod(), list=FakeMethod())
+        self.secrets = SimpleNamespace(resolve=FakeMethod())
+        self.vaults = SimpleNamespace(list=FakeMethod())
+
+
+def _is_exception(obj):
+    return isinstance(obj, BaseException) or (
+        isinstance(obj, type) and issubclass(obj, BaseException)
+    )
+
+
+@fixture
+def mock_op_client():
+    """Fake 1Password client."""
+    return FakeOP()
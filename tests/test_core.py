@@ -1,6 +1,13 @@
 """Unit tests for Configator core functionality."""
 
-from unittest.mock import AsyncMock, patch
+from asyncio import CancelledError, Event, gather, sleep, wait_for
+from asyncio import run as run_async
+from datetime import datetime
+from json import JSONDecodeError
+from math import inf, isnan
+from subprocess import run
+from sys import executable
+from unittest.mock import call
 
 from onepassword.types import Item, ItemField, ItemOverview, ItemSection, VaultOverview
 
@@ -9,19 +16,24 @@ try:
 except ImportError:
     # onepassword-sdk<0.4
     VaultType = None
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, ValidationError
 from pytest import fixture, mark, raises
 
 from configator.core import (
-    _field_matcher,
+    _CLIENTS,
+    _field_specs,
     _get_client,
     _get_item_overview,
     _get_sections,
     _get_vault_overview,
     _hydrate_model,
+    _index_fields,
+    _Kind,
+    _kind,
     _op_field_name_to_lower_snake_case,
     _parse_bool,
     _resolve_op_link,
+    _resolve_op_link_cached,
     load_config,
 )
 
@@ -49,8 +61,61 @@ class ComplexConfig(BaseModel):
     optional_field: str = "default_value"
 
 
+class CollectionConfig(BaseModel):
+    """Configuration schema with JSON collection fields."""
+
+    a_dict: dict
+    a_set: set
+
+
+class TaggedConfig(BaseModel):
+    """Configuration schema with a mutable default."""
+
+    tags: list = []
+
+
+class BoundedConfig(BaseModel):
+    """Configuration schema with a constrained field."""
+
+    ratio: float = Field(le=1.0)
+
+
+# Shared, immutable building blocks for mock Items, validated once at import
+# The SDK only accepts RFC 3339 strings for timestamps and parses them into naive datetimes
+_TS = "2024-01-01T00:00:00Z"
+_TS_PARSED = datetime(2024, 1, 1)
+_SEC1 = ItemSection(id="sec1", title="Section")
+_FIELD_ONE = ItemField(id="f1", title="field-one", fieldType="Text", value="test", sectionId=None)
+_FIELD_TWO = ItemField(id="f2", title="field-two", fieldType="Text", value="42", sectionId=None)
+
+
 # Fixtures
-@fixture
+@fixture(scope="session")
+def make_item():
+    """Return factory for mock Items with the given fields and sections."""
+
+    def _make_item(fields=(), sections=()):
+        # The building blocks are already validated, so skip validating the Item itself
+        return Item.model_construct(
+            id="item456",
+            title="TestItem",
+            vaultId="vault123",
+            category="Login",
+            fields=list(fields),
+            sections=list(sections),
+            notes="",
+            tags=[],
+            websites=[],
+            version=1,
+            files=[],
+            createdAt=_TS_PARSED,
+            updatedAt=_TS_PARSED,
+        )
+
+    return _make_item
+
+
+@fixture(scope="session")
 def mock_vault():
     """Mock VaultOverview."""
     kwargs = {"id": "vault123", "title": "TestVault"}
@@ -61,13 +126,13 @@ def mock_vault():
             activeItemCount=0,
             contentVersion=1,
             attributeVersion=1,
-            createdAt="2024-01-01T00:00:00Z",
-            updatedAt="2024-01-01T00:00:00Z",
+            createdAt=_TS,
+            updatedAt=_TS,
         )
     return VaultOverview(**kwargs)
 
 
-@fixture
+@fixture(scope="session")
 def mock_item_overview():
     """Mock ItemOverview."""
     return ItemOverview(
@@ -77,13 +142,13 @@ def mock_item_overview():
         category="Login",
         websites=[],
         tags=[],
-        createdAt="2024-01-01T00:00:00Z",
-        updatedAt="2024-01-01T00:00:00Z",
+        createdAt=_TS,
+        updatedAt=_TS,
         state="active",
     )
 
 
-@fixture
+@fixture(scope="session")
 def mock_item_field():
     """Mock ItemField."""
     return ItemField(
@@ -95,20 +160,16 @@ def mock_item_field():
     )
 
 
-@fixture
+@fixture(scope="session")
 def mock_item_section():
     """Mock ItemSection."""
     return ItemSection(id="section1", title="Section")
 
 
-@fixture
-def mock_item():
+@fixture(scope="session")
+def mock_item(make_item):
     """Mock Item with fields and sections."""
-    return Item(
-        id="item456",
-        title="TestItem",
-        vaultId="vault123",
-        category="Login",
+    return make_item(
         fields=[
             ItemField(
                 id="f1",
@@ -125,67 +186,113 @@ def mock_item():
             ),
         ],
         sections=[ItemSection(id="section1", title="Section")],
-        notes="",
-        tags=[],
-        websites=[],
-        version=1,
-        files=[],
-        createdAt="2024-01-01T00:00:00Z",
-        updatedAt="2024-01-01T00:00:00Z",
     )
 
 
-@fixture
-def mock_op_client():
-    """Mock 1Password client."""
-    client = AsyncMock()
-    client.items = AsyncMock()
-    client.vaults = AsyncMock()
-    client.secrets = AsyncMock()
-    return client
+@fixture(autouse=True, scope="module")
+def mock_authenticate(module_mocker):
+    """Keep every test in this module from authenticating a real 1Password client."""
+    return module_mocker.patch("configator.core.OnePasswordClient.authenticate")
+
 
+@fixture
+def clear_clients(mock_authenticate):
+    """Start and end with an empty 1Password client cache and a pristine authenticate mock."""
+    mock_authenticate.reset_mock(return_value=True, side_effect=True)
+    _CLIENTS.clear()
+    yield
+    _CLIENTS.clear()
+
+
+def test_package_import_defers_sdk():
+    """Test importing the package only loads the 1Password SDK once load_config is used."""
+    code = (
+        "import sys, configator; "
+        "assert 'onepassword' not in sys.modules; "
+        "from configator import load_config; "
+        "assert 'onepassword' in sys.modules"
+    )
+    # Fixed code run by the current interpreter, so there is no untrusted input
+    run([executable, "-c", code], check=True)  # noqa: S603
+
+
+# Tests for _field_specs
+def test_field_specs():
+    """Test field metadata is derived from the schema."""
+    specs = _field_specs(ComplexConfig)
+    assert [(spec.key, spec.title, spec.kind) for spec in specs] == [
+        ("simple_field", "simple_field", _Kind.SCALAR),
+        ("section", "section", _Kind.MODEL),
+        ("optional_field", "optional_field", _Kind.SCALAR),
+    ]
+    assert specs[2].default == "default_value"
+
+
+def test_field_specs_cached():
+    """Test field metadata is computed once per schema."""
+    assert _field_specs(SimpleConfig) is _field_specs(SimpleConfig)
+
+
+# Tests for _kind
+@mark.parametrize(
+    ("cls", "expected"),
+    [
+        (SectionConfig, _Kind.MODEL),
+        (dict, _Kind.JSON),
+        (list, _Kind.JSON),
+        (set, _Kind.JSON),
+        (tuple, _Kind.JSON),
+        (bool, _Kind.BOOL),
+        (int, _Kind.SCALAR),
+        (str, _Kind.SCALAR),
+        (str | None, _Kind.SCALAR),
+    ],
+)
+def test_kind(cls, expected):
+    """Test field annotations are classified by hydration strategy."""
+    assert _kind(cls) is expected
 
-# Tests for _field_matcher
-def test_field_matcher_title_match(mock_item_field):
-    """Test field matcher with matching title."""
-    assert _field_matcher(mock_item_field, title="field_one") is True
 
+# Tests for _get_client
+async def test_get_client(clear_clients, mock_authenticate):
+    """Test client initialization."""
+    client = await _get_client("test_token")
+    assert client is mock_authenticate.return_value
+    mock_authenticate.assert_called_once()
+    call_args = mock_authenticate.call_args
+    assert call_args.kwargs["auth"] == "test_token"
+    assert "integration_name" in call_args.kwargs
+    assert "integration_version" in call_args.kwargs
 
-def test_field_matcher_title_no_match(mock_item_field):
-    """Test field matcher with non-matching title."""
-    assert _field_matcher(mock_item_field, title="other_field") is False
 
+async def test_get_client_cached_per_token(clear_clients, mock_authenticate):
+    """Test client is authenticated once per token and reused afterwards."""
+    mock_authenticate.side_effect = [object(), object()]
+    first = await _get_client("test_token")
+    second = await _get_client("test_token")
+    other = await _get_client("other_token")
+    assert first is second
+    assert other is not first
+    assert mock_authenticate.call_count == 2
 
-def test_field_matcher_with_section_id():
-    """Test field matcher with section ID."""
-    field = ItemField(id="f1", title="test", fieldType="Text", value="val", sectionId="sec1")
-    assert _field_matcher(field, title="test", section_id="sec1") is True
-    assert _field_matcher(field, title="test", section_id="sec2") is False
 
+def test_get_client_across_event_loops(clear_clients, mock_authenticate):
+    """Test concurrent first calls work in separate event loops and share one client."""
 
-def test_field_matcher_normalizes_field_name():
-    """Test field matcher normalizes field names."""
-    field = ItemField(id="f1", title="Field-Name", fieldType="Text", value="val", sectionId=None)
-    assert _field_matcher(field, title="field_name") is True
+    async def authenticate(**kwargs):
+        await sleep(0)
+        return object()
 
+    async def get_twice(token):
+        return await gather(_get_client(token), _get_client(token))
 
-# Tests for _get_client
-@mark.asyncio
-async def test_get_client():
-    """Test client initialization."""
-    with patch("configator.core.OnePasswordClient.authenticate") as mock_auth:
-        mock_auth.return_value = AsyncMock()
-        client = await _get_client("test_token")
-        assert client is not None
-        mock_auth.assert_called_once()
-        call_args = mock_auth.call_args
-        assert call_args.kwargs["auth"] == "test_token"
-        assert "integration_name" in call_args.kwargs
-        assert "integration_version" in call_args.kwargs
+    mock_authenticate.side_effect = authenticate
+    for token in ("token_a", "token_b"):
+        first, second = run_async(get_twice(token))
+        assert first is second is _CLIENTS[token]
 
 
 # Tests for _get_vault_overview
-@mark.asyncio
 async def test_get_vault_overview_found(mock_op_client, mock_vault):
     """Test retrieving existing vault."""
     mock_op_client.vaults.list.return_value = [mock_vault]
@@ -193,7 +300,6 @@ async def test_get_vault_overview_found(mock_op_client, mock_vault):
     assert result == mock_vault
 
 
-@mark.asyncio
 async def test_get_vault_overview_not_found(mock_op_client, mock_vault):
     """Test retrieving non-existing vault."""
     mock_op_client.vaults.list.return_value = [mock_vault]
@@ -201,7 +307,6 @@ async def test_get_vault_overview_not_found(mock_op_client, mock_vault):
     assert result is None
 
 
-@mark.asyncio
 async def test_get_vault_overview_empty_list(mock_op_client):
     """Test retrieving vault from empty vault list."""
     mock_op_client.vaults.list.return_value = []
@@ -209,8 +314,25 @@ async def test_get_vault_overview_empty_list(mock_op_client):
     assert result is None
 
 
+async def test_get_vault_overview_cached(mock_op_client, mock_vault):
+    """Test vaults are only listed once per client when the vault is found."""
+    mock_op_client.vaults.list.return_value = [mock_vault]
+    first = await _get_vault_overview(mock_op_client, "TestVault")
+    second = await _get_vault_overview(mock_op_client, "TestVault")
+    assert first == second == mock_vault
+    assert mock_op_client.vaults.list.call_count == 1
+
+
+async def test_get_vault_overview_refreshed_on_miss(mock_op_client, mock_vault):
+    """Test vaults are listed again when the cached listing lacks the vault."""
+    mock_op_client.vaults.list.return_value = []
+    assert await _get_vault_overview(mock_op_client, "TestVault") is None
+    mock_op_client.vaults.list.return_value = [mock_vault]
+    assert await _get_vault_overview(mock_op_client, "TestVault") == mock_vault
+    assert mock_op_client.vaults.list.call_count == 2
+
+
 # Tests for _get_item_overview
-@mark.asyncio
 async def test_get_item_overview_found(mock_op_client, mock_item_overview):
     """Test retrieving existing item."""
     mock_op_client.items.list.return_value = [mock_item_overview]
@@ -218,7 +340,6 @@ async def test_get_item_overview_found(mock_op_client, mock_item_overview):
     assert result == mock_item_overview
 
 
-@mark.asyncio
 async def test_get_item_overview_not_found(mock_op_client, mock_item_overview):
     """Test retrieving non-existing item."""
     mock_op_client.items.list.return_value = [mock_item_overview]
@@ -226,7 +347,6 @@ async def test_get_item_overview_not_found(mock_op_client, mock_item_overview):
     assert result is None
 
 
-@mark.asyncio
 async def test_get_item_overview_empty_list(mock_op_client):
     """Test retrieving item from empty item list."""
     mock_op_client.items.list.return_value = []
@@ -234,77 +354,93 @@ async def test_get_item_overview_empty_list(mock_op_client):
     assert result is None
 
 
+async def test_get_item_overview_cached(mock_op_client, mock_item_overview):
+    """Test items are only listed once per client and vault when the item is found."""
+    mock_op_client.items.list.return_value = [mock_item_overview]
+    first = await _get_item_overview(mock_op_client, "vault123", "TestItem")
+    second = await _get_item_overview(mock_op_client, "vault123", "TestItem")
+    assert first == second == mock_item_overview
+    assert mock_op_client.items.list.calls == [call(vault_id="vault123")]
+
+
+async def test_get_item_overview_cached_per_vault(mock_op_client, mock_item_overview):
+    """Test item listings are cached separately for each vault."""
+    mock_op_client.items.list.return_value = [mock_item_overview]
+    await _get_item_overview(mock_op_client, "vault123", "TestItem")
+    await _get_item_overview(mock_op_client, "vault456", "TestItem")
+    assert mock_op_client.items.list.call_count == 2
+
+
 # Tests for _get_sections
-def test_get_sections():
+def test_get_sections(make_item):
     """Test extracting section mapping from item."""
-    item = Item(
-        id="item1",
-        title="Test",
-        vaultId="vault1",
-        category="Login",
-        fields=[],
+    item = make_item(
         sections=[
             ItemSection(id="sec1", title="Section One"),
             ItemSection(id="sec2", title="Section Two"),
         ],
-        notes="",
-        tags=[],
-        websites=[],
-        version=1,
-        files=[],
-        createdAt="2024-01-01T00:00:00Z",
-        updatedAt="2024-01-01T00:00:00Z",
     )
     sections = _get_sections(item)
     assert sections == {"section one": "sec1", "section two": "sec2"}
 
 
-def test_get_sections_empty():
+def test_get_sections_empty(make_item):
     """Test extracting sections from item with no sections."""
-    item = Item(
-        id="item1",
-        title="Test",
-        vaultId="vault1",
-        category="Login",
-        fields=[],
-        sections=[],
-        notes="",
-        tags=[],
-        websites=[],
-        version=1,
-        files=[],
-        createdAt="2024-01-01T00:00:00Z",
-        updatedAt="2024-01-01T00:00:00Z",
-    )
+    item = make_item()
     sections = _get_sections(item)
     assert sections == {}
 
 
-def test_get_sections_with_none_title():
+def test_get_sections_with_none_title(make_item):
     """Test extracting sections when some sections might be filtered."""
-    item = Item(
-        id="item1",
-        title="Test",
-        vaultId="vault1",
-        category="Login",
-        fields=[],
+    item = make_item(
         sections=[
             ItemSection(id="sec1", title="Section One"),
             ItemSection(id="sec2", title=""),
         ],
-        notes="",
-        tags=[],
-        websites=[],
-        version=1,
-        files=[],
-        createdAt="2024-01-01T00:00:00Z",
-        updatedAt="2024-01-01T00:00:00Z",
     )
     sections = _get_sections(item)
     # Empty string title is falsy, so it's filtered out
     assert sections == {"section one": "sec1"}
 
 
+# Tests for _index_fields
+def test_index_fields(mock_item):
+    """Test fields are indexed by normalized title, with and without section ID."""
+    simple, debug, timeout = mock_item.fields
+    assert _index_fields(mock_item) == {
+        ("simple_field", None): simple,
+        ("debug", "section1"): debug,
+        ("debug", None): debug,
+        ("timeout", "section1"): timeout,
+        ("timeout", None): timeout,
+    }
+
+
+def test_index_fields_section_scoped(mock_item_field, make_item):
+    """Test fields are only indexed under their own section ID besides the root lookup."""
+    field = ItemField(id="f1", title="test", fieldType="Text", value="val", sectionId="sec1")
+    item = make_item(
+        fields=[field, mock_item_field],
+    )
+    field_index = _index_fields(item)
+    assert field_index[("test", "sec1")] is field
+    assert ("test", "sec2") not in field_index
+    assert field_index[("field_one", None)] is mock_item_field
+
+
+def test_index_fields_first_match_wins(make_item):
+    """Test the first field wins when titles collide after normalization."""
+    first = ItemField(id="f1", title="api-key", fieldType="Text", value="1", sectionId="sec1")
+    second = ItemField(id="f2", title="API_KEY", fieldType="Text", value="2", sectionId="sec2")
+    item = make_item(
+        fields=[first, second],
+    )
+    field_index = _index_fields(item)
+    assert field_index[("api_key", None)] is first
+    assert field_index[("api_key", "sec2")] is second
+
+
 # Tests for _op_field_name_to_lower_snake_case
 def test_op_field_name_to_lower_snake_case():
     """Test field name normalization."""
@@ -312,33 +448,37 @@ def test_op_field_name_to_lower_snake_case():
     assert _op_field_name_to_lower_snake_case("Simple") == "simple"
     assert _op_field_name_to_lower_snake_case("Multi-Word-Field") == "multi_word_field"
     assert _op_field_name_to_lower_snake_case("UPPERCASE") == "uppercase"
+    assert _op_field_name_to_lower_snake_case("DATABASE_HOST") == "database_host"
+    assert _op_field_name_to_lower_snake_case("Ærø-Ø") == "ærø_ø"
 
 
 # Tests for _parse_bool
-def test_parse_bool_truthy_values():
-    """Test parsing truthy boolean values."""
-    assert _parse_bool("true") is True
-    assert _parse_bool("True") is True
-    assert _parse_bool("TRUE") is True
-    assert _parse_bool("1") is True
-    assert _parse_bool("yes") is True
-    assert _parse_bool("YES") is True
-    assert _parse_bool("on") is True
-    assert _parse_bool("ON") is True
-    assert _parse_bool(" true ") is True
-
-
-def test_parse_bool_falsy_values():
-    """Test parsing falsy boolean values."""
-    assert _parse_bool("false") is False
-    assert _parse_bool("False") is False
-    assert _parse_bool("FALSE") is False
-    assert _parse_bool("0") is False
-    assert _parse_bool("no") is False
-    assert _parse_bool("NO") is False
-    assert _parse_bool("off") is False
-    assert _parse_bool("OFF") is False
-    assert _parse_bool(" false ") is False
+@mark.parametrize(
+    ("str_val", "expected"),
+    [
+        ("true", True),
+        ("True", True),
+        ("TRUE", True),
+        ("1", True),
+        ("yes", True),
+        ("YES", True),
+        ("on", True),
+        ("ON", True),
+        (" true ", True),
+        ("false", False),
+        ("False", False),
+        ("FALSE", False),
+        ("0", False),
+        ("no", False),
+        ("NO", False),
+        ("off", False),
+        ("OFF", False),
+        (" false ", False),
+    ],
+)
+def test_parse_bool(str_val, expected):
+    """Test parsing truthy and falsy boolean values."""
+    assert _parse_bool(str_val) is expected
 
 
 def test_parse_bool_invalid_value():
@@ -348,24 +488,21 @@ def test_parse_bool_invalid_value():
 
 
 # Tests for _resolve_op_link
-@mark.asyncio
 async def test_resolve_op_link_no_link(mock_op_client):
     """Test resolving non-op:// link."""
     result = await _resolve_op_link(mock_op_client, "plain_value")
     assert result == "plain_value"
-    mock_op_client.secrets.resolve.assert_not_called()
+    assert mock_op_client.secrets.resolve.calls == []
 
 
-@mark.asyncio
 async def test_resolve_op_link_single_link(mock_op_client):
     """Test resolving single op:// link."""
     mock_op_client.secrets.resolve.return_value = "resolved_value"
     result = await _resolve_op_link(mock_op_client, "op://vault/item/field")
     assert result == "resolved_value"
-    mock_op_client.secrets.resolve.assert_called_once_with("op://vault/item/field")
+    assert mock_op_client.secrets.resolve.calls == [call("op://vault/item/field")]
 
 
-@mark.asyncio
 async def test_resolve_op_link_nested_links(mock_op_client):
     """Test resolving nested op:// links."""
     mock_op_client.secrets.resolve.side_effect = [
@@ -377,7 +514,6 @@ async def test_resolve_op_link_nested_links(mock_op_client):
     assert mock_op_client.secrets.resolve.call_count == 2
 
 
-@mark.asyncio
 async def test_resolve_op_link_resolution_error(mock_op_client):
     """Test resolving op:// link includes the reference in the error message."""
     mock_op_client.secrets.resolve.side_effect = Exception("no vault matched the secret reference query")
@@ -385,41 +521,51 @@ async def test_resolve_op_link_resolution_error(mock_op_client):
         await _resolve_op_link(mock_op_client, "op://vault/item/field")
 
 
-@mark.asyncio
 async def test_resolve_op_link_too_deep(mock_op_client):
     """Test resolving op:// link with too many levels raises RuntimeError."""
     mock_op_client.secrets.resolve.return_value = "op://vault/item/field"
     with raises(RuntimeError, match="the dwarves delved too greedily and too deep"):
         await _resolve_op_link(mock_op_client, "op://vault/item/field")
+    assert mock_op_client.secrets.resolve.call_count == 10
+
+
+async def test_resolve_op_link_max_depth(mock_op_client):
+    """Test resolving a chain of exactly ten op:// links succeeds."""
+    links = [f"op://vault/item/field{i}" for i in range(9)]
+    mock_op_client.secrets.resolve.side_effect = [*links, "final_value"]
+    result = await _resolve_op_link(mock_op_client, "op://vault/item/field")
+    assert result == "final_value"
+    assert mock_op_client.secrets.resolve.call_count == 10
+
+
+# Tests for _resolve_op_link_cached
+async def test_resolve_op_link_cached_no_link(mock_op_client):
+    """Test plain values are neither resolved nor cached."""
+    resolved = {}
+    result = await _resolve_op_link_cached(mock_op_client, "plain_value", resolved)
+    assert result == "plain_value"
+    assert resolved == {}
+    assert mock_op_client.secrets.resolve.calls == []
+
+
+async def test_resolve_op_link_cached_reuses_result(mock_op_client):
+    """Test the same op:// link is only resolved once per cache."""
+    mock_op_client.secrets.resolve.return_value = "resolved_value"
+    resolved = {}
+    first = await _resolve_op_link_cached(mock_op_client, "op://vault/item/field", resolved)
+    second = await _resolve_op_link_cached(mock_op_client, "op://vault/item/field", resolved)
+    assert first == second == "resolved_value"
+    assert mock_op_client.secrets.resolve.calls == [call("op://vault/item/field")]
 
 
 # Tests for _hydrate_model
-@mark.asyncio
-async def test_hydrate_model_simple(mock_op_client):
+async def test_hydrate_model_simple(mock_op_client, make_item):
     """Test hydrating simple model."""
-    item = Item(
-        id="item1",
-        title="Test",
-        vaultId="vault1",
-        category="Login",
+    item = make_item(
         fields=[
-            ItemField(
-                id="f1",
-                title="field-one",
-                fieldType="Text",
-                value="test",
-                sectionId=None,
-            ),
-            ItemField(id="f2", title="field-two", fieldType="Text", value="42", sectionId=None),
+            _FIELD_ONE,
+            _FIELD_TWO,
         ],
-        sections=[],
-        notes="",
-        tags=[],
-        websites=[],
-        version=1,
-        files=[],
-        createdAt="2024-01-01T00:00:00Z",
-        updatedAt="2024-01-01T00:00:00Z",
     )
     mock_op_client.secrets.resolve.side_effect = lambda x: x
     result = await _hydrate_model(op_client=mock_op_client, schema=SimpleConfig, item=item)
@@ -427,26 +573,14 @@ async def test_hydrate_model_simple(mock_op_client):
     assert result.field_two == 42
 
 
-@mark.asyncio
-async def test_hydrate_model_with_bool(mock_op_client):
+async def test_hydrate_model_with_bool(mock_op_client, make_item):
     """Test hydrating model with boolean field."""
-    item = Item(
-        id="item1",
-        title="Test",
-        vaultId="vault1",
-        category="Login",
+    item = make_item(
         fields=[
             ItemField(id="f1", title="debug", fieldType="Text", value="true", sectionId="sec1"),
             ItemField(id="f2", title="timeout", fieldType="Text", value="30", sectionId="sec1"),
         ],
-        sections=[ItemSection(id="sec1", title="Section")],
-        notes="",
-        tags=[],
-        websites=[],
-        version=1,
-        files=[],
-        createdAt="2024-01-01T00:00:00Z",
-        updatedAt="2024-01-01T00:00:00Z",
+        sections=[_SEC1],
     )
     mock_op_client.secrets.resolve.side_effect = lambda x: x
     result = await _hydrate_model(
@@ -456,14 +590,9 @@ async def test_hydrate_model_with_bool(mock_op_client):
     assert result.timeout == 30
 
 
-@mark.asyncio
-async def test_hydrate_model_with_default_value(mock_op_client):
+async def test_hydrate_model_with_default_value(mock_op_client, make_item):
     """Test hydrating model with default value when field missing."""
-    item = Item(
-        id="item1",
-        title="Test",
-        vaultId="vault1",
-        category="Login",
+    item = make_item(
         fields=[
             ItemField(
                 id="f1",
@@ -475,14 +604,7 @@ async def test_hydrate_model_with_default_value(mock_op_client):
             ItemField(id="f2", title="debug", fieldType="Text", value="false", sectionId="sec1"),
             ItemField(id="f3", title="timeout", fieldType="Text", value="60", sectionId="sec1"),
         ],
-        sections=[ItemSection(id="sec1", title="Section")],
-        notes="",
-        tags=[],
-        websites=[],
-        version=1,
-        files=[],
-        createdAt="2024-01-01T00:00:00Z",
-        updatedAt="2024-01-01T00:00:00Z",
+        sections=[_SEC1],
     )
     mock_op_client.secrets.resolve.side_effect = lambda x: x
     result = await _hydrate_model(op_client=mock_op_client, schema=ComplexConfig, item=item)
@@ -492,79 +614,220 @@ async def test_hydrate_model_with_default_value(mock_op_client):
     assert result.optional_field == "default_value"
 
 
-@mark.asyncio
-async def test_hydrate_model_missing_required_field(mock_op_client):
+@mark.parametrize("validate", [True, False])
+async def test_hydrate_model_mutable_default_not_shared(mock_op_client, make_item, validate):
+    """Test each hydrated model gets its own copy of a mutable default value."""
+    item = make_item()
+    first = await _hydrate_model(
+        op_client=mock_op_client, schema=TaggedConfig, item=item, validate=validate
+    )
+    first.tags.append("oops")
+    second = await _hydrate_model(
+        op_client=mock_op_client, schema=TaggedConfig, item=item, validate=validate
+    )
+    assert second.tags == []
+    assert TaggedConfig.model_fields["tags"].default == []
+
+
+async def test_hydrate_model_missing_required_field(mock_op_client, make_item):
     """Test hydrating model with missing required field raises RuntimeError."""
-    item = Item(
-        id="item1",
-        title="Test",
-        vaultId="vault1",
-        category="Login",
+    item = make_item(
+        fields=[_FIELD_ONE],
+    )
+    mock_op_client.secrets.resolve.side_effect = lambda x: x
+    with raises(RuntimeError, match="field 'field_two' not found and no default value provided"):
+        await _hydrate_model(op_client=mock_op_client, schema=SimpleConfig, item=item)
+
+
+async def test_hydrate_model_with_op_link(mock_op_client, make_item):
+    """Test hydrating model with op:// reference."""
+    item = make_item(
         fields=[
             ItemField(
                 id="f1",
                 title="field-one",
                 fieldType="Text",
-                value="test",
+                value="op://vault/item/field",
                 sectionId=None,
-            )
+            ),
+            _FIELD_TWO,
+        ],
+    )
+    mock_op_client.secrets.resolve.return_value = "resolved_value"
+    result = await _hydrate_model(op_client=mock_op_client, schema=SimpleConfig, item=item)
+    assert result.field_one == "resolved_value"
+    assert result.field_two == 42
+
+
+async def test_hydrate_model_with_json(mock_op_client, make_item):
+    """Test hydrating model with collection fields parsed from JSON."""
+    item = make_item(
+        fields=[
+            ItemField(id="f1", title="a-dict", fieldType="Text", value='{"a": 1}', sectionId=None),
+            ItemField(
+                id="f2", title="a-set", fieldType="Text", value='["x", "x", "y"]', sectionId=None
+            ),
         ],
-        sections=[],
-        notes="",
-        tags=[],
-        websites=[],
-        version=1,
-        files=[],
-        createdAt="2024-01-01T00:00:00Z",
-        updatedAt="2024-01-01T00:00:00Z",
     )
     mock_op_client.secrets.resolve.side_effect = lambda x: x
-    # StopIteration in async context is wrapped in RuntimeError (PEP 479)
-    with raises(RuntimeError, match="coroutine raised StopIteration"):
-        await _hydrate_model(op_client=mock_op_client, schema=SimpleConfig, item=item)
+    result = await _hydrate_model(op_client=mock_op_client, schema=CollectionConfig, item=item)
+    assert result.a_dict == {"a": 1}
+    assert result.a_set == {"x", "y"}
 
 
-@mark.asyncio
-async def test_hydrate_model_with_op_link(mock_op_client):
-    """Test hydrating model with op:// reference."""
-    item = Item(
-        id="item1",
-        title="Test",
-        vaultId="vault1",
-        category="Login",
+async def test_hydrate_model_with_json_edge_values(mock_op_client, make_item):
+    """Test JSON fields keep big integers exact and accept non-finite floats."""
+    value = '{"n": 123456789012345678901234567890, "nan": NaN, "inf": Infinity, "big": 1e400}'
+    item = make_item(
+        fields=[
+            ItemField(id="f1", title="a-dict", fieldType="Text", value=value, sectionId=None),
+            ItemField(id="f2", title="a-set", fieldType="Text", value="[]", sectionId=None),
+        ],
+    )
+    mock_op_client.secrets.resolve.side_effect = lambda x: x
+    result = await _hydrate_model(op_client=mock_op_client, schema=CollectionConfig, item=item)
+    assert result.a_dict["n"] == 123456789012345678901234567890
+    assert isnan(result.a_dict["nan"])
+    assert result.a_dict["inf"] == result.a_dict["big"] == inf
+
+
+async def test_hydrate_model_with_invalid_json(mock_op_client, make_item):
+    """Test hydrating model with malformed JSON raises JSONDecodeError."""
+    item = make_item(
+        fields=[
+            ItemField(id="f1", title="a-dict", fieldType="Text", value="{bad", sectionId=None),
+            ItemField(id="f2", title="a-set", fieldType="Text", value="[]", sectionId=None),
+        ],
+    )
+    mock_op_client.secrets.resolve.side_effect = lambda x: x
+    with raises(JSONDecodeError):
+        await _hydrate_model(op_client=mock_op_client, schema=CollectionConfig, item=item)
+
+
+async def test_hydrate_model_resolves_fields_concurrently(mock_op_client, make_item):
+    """Test hydrating model resolves op:// references for all fields concurrently."""
+    item = make_item(
         fields=[
             ItemField(
                 id="f1",
                 title="field-one",
                 fieldType="Text",
-                value="op://vault/item/field",
+                value="op://vault/item/one",
+                sectionId=None,
+            ),
+            ItemField(
+                id="f2",
+                title="field-two",
+                fieldType="Text",
+                value="op://vault/item/two",
                 sectionId=None,
             ),
-            ItemField(id="f2", title="field-two", fieldType="Text", value="42", sectionId=None),
         ],
-        sections=[],
-        notes="",
-        tags=[],
-        websites=[],
-        version=1,
-        files=[],
-        createdAt="2024-01-01T00:00:00Z",
-        updatedAt="2024-01-01T00:00:00Z",
     )
-    mock_op_client.secrets.resolve.return_value = "resolved_value"
+    both_pending = Event()
+    pending = []
+
+    async def resolve(link):
+        pending.append(link)
+        if len(pending) == 2:
+            both_pending.set()
+        # Would deadlock if the second field were only resolved after the first one
+        await wait_for(both_pending.wait(), timeout=1)
+        return "42" if link.endswith("two") else "resolved_value"
+
+    mock_op_client.secrets.resolve.side_effect = resolve
     result = await _hydrate_model(op_client=mock_op_client, schema=SimpleConfig, item=item)
     assert result.field_one == "resolved_value"
     assert result.field_two == 42
 
 
-@mark.asyncio
-async def test_hydrate_model_nested_sections(mock_op_client):
+async def test_hydrate_model_failure_cancels_pending_resolutions(mock_op_client, make_item):
+    """Test a failing field cancels op:// resolutions still in flight for other fields."""
+    item = make_item(
+        fields=[
+            ItemField(
+                id="f1",
+                title="field-one",
+                fieldType="Text",
+                value="op://vault/item/one",
+                sectionId=None,
+            ),
+        ],
+    )
+    started = Event()
+    cancelled = Event()
+
+    async def resolve(link):
+        started.set()
+        try:
+            await Event().wait()
+        except CancelledError:
+            cancelled.set()
+            raise
+        raise Exception("resolved after the load already failed")
+
+    mock_op_client.secrets.resolve.side_effect = resolve
+    with raises(RuntimeError, match="field 'field_two' not found"):
+        await _hydrate_model(op_client=mock_op_client, schema=SimpleConfig, item=item)
+    assert started.is_set()
+    await wait_for(cancelled.wait(), timeout=1)
+
+
+async def test_hydrate_model_nested_resolution_error(mock_op_client, make_item):
+    """Test a failed op:// resolution in a nested model fails the whole hydration."""
+    item = make_item(
+        fields=[
+            ItemField(
+                id="f1", title="simple-field", fieldType="Text", value="test", sectionId=None
+            ),
+            ItemField(id="f2", title="debug", fieldType="Text", value="no", sectionId="sec1"),
+            ItemField(
+                id="f3",
+                title="timeout",
+                fieldType="Text",
+                value="op://vault/item/timeout",
+                sectionId="sec1",
+            ),
+        ],
+        sections=[_SEC1],
+    )
+    mock_op_client.secrets.resolve.side_effect = Exception("no such secret")
+    with raises(RuntimeError, match="failed to resolve secret reference 'op://vault/item/"):
+        await _hydrate_model(op_client=mock_op_client, schema=ComplexConfig, item=item)
+
+
+async def test_hydrate_model_resolves_shared_link_once(mock_op_client, make_item):
+    """Test an op:// link used by fields in different sections is resolved once."""
+    item = make_item(
+        fields=[
+            ItemField(
+                id="f1",
+                title="simple-field",
+                fieldType="Text",
+                value="op://vault/item/shared",
+                sectionId=None,
+            ),
+            ItemField(id="f2", title="debug", fieldType="Text", value="yes", sectionId="sec1"),
+            ItemField(
+                id="f3",
+                title="timeout",
+                fieldType="Text",
+                value="op://vault/item/shared",
+                sectionId="sec1",
+            ),
+        ],
+        sections=[_SEC1],
+    )
+    mock_op_client.secrets.resolve.return_value = "7"
+    result = await _hydrate_model(op_client=mock_op_client, schema=ComplexConfig, item=item)
+    assert result.simple_field == "7"
+    assert result.section.timeout == 7
+    assert mock_op_client.secrets.resolve.calls == [call("op://vault/item/shared")]
+
+
+async def test_hydrate_model_nested_sections(mock_op_client, make_item):
     """Test hydrating model with nested sections."""
-    item = Item(
-        id="item1",
-        title="Test",
-        vaultId="vault1",
-        category="Login",
+    item = make_item(
         fields=[
             ItemField(
                 id="f1", title="simple-field", fieldType="Text", value="test", sectionId=None
@@ -572,14 +835,7 @@ async def test_hydrate_model_nested_sections(mock_op_client):
             ItemField(id="f2", title="debug", fieldType="Text", value="yes", sectionId="sec1"),
             ItemField(id="f3", title="timeout", fieldType="Text", value="100", sectionId="sec1"),
         ],
-        sections=[ItemSection(id="sec1", title="Section")],
-        notes="",
-        tags=[],
-        websites=[],
-        version=1,
-        files=[],
-        createdAt="2024-01-01T00:00:00Z",
-        updatedAt="2024-01-01T00:00:00Z",
+        sections=[_SEC1],
     )
     mock_op_client.secrets.resolve.side_effect = lambda x: x
     result = await _hydrate_model(op_client=mock_op_client, schema=ComplexConfig, item=item)
@@ -589,15 +845,55 @@ async def test_hydrate_model_nested_sections(mock_op_client):
     assert result.section.timeout == 100
 
 
+async def test_hydrate_model_without_validation(mock_op_client, make_item):
+    """Test hydrating model with validation disabled still hydrates nested models."""
+    item = make_item(
+        fields=[
+            ItemField(
+                id="f1", title="simple-field", fieldType="Text", value="test", sectionId=None
+            ),
+            ItemField(id="f2", title="debug", fieldType="Text", value="no", sectionId="sec1"),
+            ItemField(id="f3", title="timeout", fieldType="Text", value="5", sectionId="sec1"),
+        ],
+        sections=[_SEC1],
+    )
+    mock_op_client.secrets.resolve.side_effect = lambda x: x
+    result = await _hydrate_model(
+        op_client=mock_op_client, schema=ComplexConfig, item=item, validate=False
+    )
+    assert result.simple_field == "test"
+    assert isinstance(result.section, SectionConfig)
+    assert result.section.debug is False
+    assert result.section.timeout == 5
+    assert result.optional_field == "default_value"
+
+
+async def test_hydrate_model_validation_toggle(mock_op_client, make_item):
+    """Test field constraints are only enforced when validation is enabled."""
+    item = make_item(
+        fields=[ItemField(id="f1", title="ratio", fieldType="Text", value="2.5", sectionId=None)],
+    )
+    mock_op_client.secrets.resolve.side_effect = lambda x: x
+    with raises(ValidationError):
+        await _hydrate_model(op_client=mock_op_client, schema=BoundedConfig, item=item)
+    result = await _hydrate_model(
+        op_client=mock_op_client, schema=BoundedConfig, item=item, validate=False
+    )
+    assert result.ratio == 2.5
+
+
 # Tests for load_config
-@mark.asyncio
-async def test_load_config_success(mock_op_client, mock_vault, mock_item_overview):
+@fixture
+def patched_get_client(mocker, mock_op_client):
+    """Make load_config use the fake 1Password client."""
+    mocker.patch("configator.core._get_client", return_value=mock_op_client)
+    return mock_op_client
+
+
+@mark.usefixtures("patched_get_client")
+async def test_load_config_success(mock_op_client, mock_vault, mock_item_overview, make_item):
     """Test successful config loading."""
-    item = Item(
-        id="item456",
-        title="TestItem",
-        vaultId="vault123",
-        category="Login",
+    item = make_item(
         fields=[
             ItemField(
                 id="f1",
@@ -608,70 +904,159 @@ async def test_load_config_success(mock_op_client, mock_vault, mock_item_overvie
             ),
             ItemField(id="f2", title="field-two", fieldType="Text", value="123", sectionId=None),
         ],
-        sections=[],
-        notes="",
-        tags=[],
-        websites=[],
-        version=1,
-        files=[],
-        createdAt="2024-01-01T00:00:00Z",
-        updatedAt="2024-01-01T00:00:00Z",
     )
 
-    with patch("configator.core._get_client", return_value=mock_op_client):
-        mock_op_client.vaults.list.return_value = [mock_vault]
-        mock_op_client.items.list.return_value = [mock_item_overview]
-        mock_op_client.items.get.return_value = item
-        mock_op_client.secrets.resolve.side_effect = lambda x: x
+    mock_op_client.vaults.list.return_value = [mock_vault]
+    mock_op_client.items.list.return_value = [mock_item_overview]
+    mock_op_client.items.get.return_value = item
+    mock_op_client.secrets.resolve.side_effect = lambda x: x
 
-        result = await load_config(
-            token="test_token", vault="TestVault", item="TestItem", schema=SimpleConfig
-        )
+    result = await load_config(
+        token="test_token", vault="TestVault", item="TestItem", schema=SimpleConfig
+    )
 
-        assert isinstance(result, SimpleConfig)
-        assert result.field_one == "test_value"
-        assert result.field_two == 123
+    assert isinstance(result, SimpleConfig)
+    assert result.field_one == "test_value"
+    assert result.field_two == 123
 
 
-@mark.asyncio
+@mark.usefixtures("patched_get_client")
 async def test_load_config_vault_not_found(mock_op_client):
     """Test config loading with non-existent vault."""
-    with patch("configator.core._get_client", return_value=mock_op_client):
-        mock_op_client.vaults.list.return_value = []
+    mock_op_client.vaults.list.return_value = []
 
-        with raises(RuntimeError, match="vault 'NonExistentVault' not found"):
-            await load_config(
-                token="test_token",
-                vault="NonExistentVault",
-                item="TestItem",
-                schema=SimpleConfig,
-            )
+    with raises(RuntimeError, match="vault 'NonExistentVault' not found"):
+        await load_config(
+            token="test_token",
+            vault="NonExistentVault",
+            item="TestItem",
+            schema=SimpleConfig,
+        )
 
 
-@mark.asyncio
+@mark.usefixtures("patched_get_client")
 async def test_load_config_item_not_found(mock_op_client, mock_vault):
     """Test config loading with non-existent item."""
-    with patch("configator.core._get_client", return_value=mock_op_client):
-        mock_op_client.vaults.list.return_value = [mock_vault]
-        mock_op_client.items.list.return_value = []
+    mock_op_client.vaults.list.return_value = [mock_vault]
+    mock_op_client.items.list.return_value = []
 
-        with raises(RuntimeError, match="item 'NonExistentItem' not found in vault TestVault"):
-            await load_config(
-                token="test_token",
-                vault="TestVault",
-                item="NonExistentItem",
-                schema=SimpleConfig,
-            )
+    with raises(RuntimeError, match="item 'NonExistentItem' not found in vault TestVault"):
+        await load_config(
+            token="test_token",
+            vault="TestVault",
+            item="NonExistentItem",
+            schema=SimpleConfig,
+        )
 
 
-@fixture
-def complex_item():
+@mark.usefixtures("patched_get_client")
+async def test_load_config_item_recreated(
+    mock_op_client, mock_vault, mock_item_overview, make_item
+):
+    """Test a stale cached item overview is refreshed when the item cannot be fetched."""
+    recreated = mock_item_overview.model_copy(update={"id": "item789"})
+    item = make_item(fields=[_FIELD_ONE, _FIELD_TWO])
+
+    async def get_item(vault_id, item_id):
+        if item_id != mock_op_client.items.list.return_value[0].id:
+            raise Exception("item not found")
+        return item
+
+    mock_op_client.vaults.list.return_value = [mock_vault]
+    mock_op_client.items.list.return_value = [mock_item_overview]
+    mock_op_client.items.get.side_effect = get_item
+    mock_op_client.secrets.resolve.side_effect = lambda x: x
+    await load_config(token="test_token", vault="TestVault", item="TestItem", schema=SimpleConfig)
+
+    mock_op_client.items.list.return_value = [recreated]
+    result = await load_config(
+        token="test_token", vault="TestVault", item="TestItem", schema=SimpleConfig
+    )
+
+    assert result.field_one == "test"
+    assert mock_op_client.items.list.call_count == 2
+    assert mock_op_client.items.get.calls[-2:] == [
+        call(vault_id="vault123", item_id="item456"),
+        call(vault_id="vault123", item_id="item789"),
+    ]
+
+
+@mark.usefixtures("patched_get_client")
+async def test_load_config_item_renamed(mock_op_client, mock_vault, mock_item_overview, make_item):
+    """Test a renamed item is not loaded in place of a new item with its old title."""
+    items = {"item456": make_item(fields=[_FIELD_ONE, _FIELD_TWO])}
+    mock_op_client.vaults.list.return_value = [mock_vault]
+    mock_op_client.items.list.return_value = [mock_item_overview]
+    mock_op_client.items.get.side_effect = lambda vault_id, item_id: items[item_id]
+    mock_op_client.secrets.resolve.side_effect = lambda x: x
+    await load_config(token="test_token", vault="TestVault", item="TestItem", schema=SimpleConfig)
+
+    items["item456"] = items["item456"].model_copy(update={"title": "TestItem-old"})
+    items["item789"] = make_item(
+        fields=[_FIELD_ONE.model_copy(update={"value": "new"}), _FIELD_TWO]
+    ).model_copy(update={"id": "item789"})
+    mock_op_client.items.list.return_value = [
+        mock_item_overview.model_copy(update={"title": "TestItem-old"}),
+        mock_item_overview.model_copy(update={"id": "item789"}),
+    ]
+    result = await load_config(
+        token="test_token", vault="TestVault", item="TestItem", schema=SimpleConfig
+    )
+
+    assert result.field_one == "new"
+    assert mock_op_client.items.get.calls[-1] == call(vault_id="vault123", item_id="item789")
+
+
+@mark.usefixtures("patched_get_client")
+async def test_load_config_item_removed(mock_op_client, mock_vault, mock_item_overview):
+    """Test an item removed after its overview was cached is reported as not found."""
+    mock_op_client.vaults.list.return_value = [mock_vault]
+    mock_op_client.items.list.side_effect = [[mock_item_overview], []]
+    mock_op_client.items.get.side_effect = Exception("item not found")
+
+    with raises(RuntimeError, match="item 'TestItem' not found in vault TestVault"):
+        await load_config(
+            token="test_token", vault="TestVault", item="TestItem", schema=SimpleConfig
+        )
+
+
+@mark.usefixtures("patched_get_client")
+async def test_load_config_vault_recreated(
+    mock_op_client, mock_vault, mock_item_overview, make_item
+):
+    """Test a vault recreated under the same title is looked up again instead of its old ID."""
+    vaults = {"vault123": make_item(fields=[_FIELD_ONE, _FIELD_TWO])}
+
+    async def get_item(vault_id, item_id):
+        if vault_id not in vaults:
+            raise Exception("vault not found")
+        return vaults[vault_id]
+
+    mock_op_client.vaults.list.return_value = [mock_vault]
+    mock_op_client.items.list.return_value = [mock_item_overview]
+    mock_op_client.items.get.side_effect = get_item
+    mock_op_client.secrets.resolve.side_effect = lambda x: x
+    await load_config(token="test_token", vault="TestVault", item="TestItem", schema=SimpleConfig)
+
+    vaults["vault789"] = vaults.pop("vault123").model_copy(update={"vault_id": "vault789"})
+    mock_op_client.vaults.list.return_value = [mock_vault.model_copy(update={"id": "vault789"})]
+    mock_op_client.items.list.return_value = [
+        mock_item_overview.model_copy(update={"vault_id": "vault789"})
+    ]
+    for _ in range(2):
+        result = await load_config(
+            token="test_token", vault="TestVault", item="TestItem", schema=SimpleConfig
+        )
+        assert result.field_one == "test"
+
+    assert mock_op_client.vaults.list.call_count == 2
+    assert mock_op_client.items.get.calls[-1] == call(vault_id="vault789", item_id="item456")
+
+
+@fixture(scope="session")
+def complex_item(make_item):
     """Mock Item with fields for ComplexConfig."""
-    return Item(
-        id="item456",
-        title="TestItem",
-        vaultId="vault123",
-        category="Login",
+    return make_item(
         fields=[
             ItemField(
                 id="f1",
@@ -690,56 +1075,53 @@ def complex_item():
                 sectionId=None,
             ),
         ],
-        sections=[ItemSection(id="sec1", title="Section")],
-        notes="",
-        tags=[],
-        websites=[],
-        version=1,
-        files=[],
-        createdAt="2024-01-01T00:00:00Z",
-        updatedAt="2024-01-01T00:00:00Z",
+        sections=[_SEC1],
     )
 
 
-@mark.asyncio
+@mark.usefixtures("patched_get_client")
 async def test_load_config_complex_schema(
     mock_op_client, mock_vault, mock_item_overview, complex_item
 ):
     """Test config loading with complex nested schema."""
-    with patch("configator.core._get_client", return_value=mock_op_client):
-        mock_op_client.vaults.list.return_value = [mock_vault]
-        mock_op_client.items.list.return_value = [mock_item_overview]
-        mock_op_client.items.get.return_value = complex_item
-        mock_op_client.secrets.resolve.side_effect = lambda x: x
+    mock_op_client.vaults.list.return_value = [mock_vault]
+    mock_op_client.items.list.return_value = [mock_item_overview]
+    mock_op_client.items.get.return_value = complex_item
+    mock_op_client.secrets.resolve.side_effect = lambda x: x
 
-        result = await load_config(
-            token="test_token", vault="TestVault", item="TestItem", schema=ComplexConfig
-        )
+    result = await load_config(
+        token="test_token", vault="TestVault", item="TestItem", schema=ComplexConfig
+    )
 
-        assert isinstance(result, ComplexConfig)
-        assert result.simple_field == "simple"
-        assert isinstance(result.section, SectionConfig)
-        assert result.section.debug is True
-        assert result.section.timeout == 200
-        assert result.optional_field == "custom"
+    assert isinstance(result, ComplexConfig)
+    assert result.simple_field == "simple"
+    assert isinstance(result.section, SectionConfig)
+    assert result.section.debug is True
+    assert result.section.timeout == 200
+    assert result.optional_field == "custom"
 
 
-@mark.asyncio
+@mark.usefixtures("patched_get_client")
 async def test_load_config_complex_schema_idempotent(
     mock_op_client, mock_vault, mock_item_overview, complex_item
 ):
-    """Test that loading complex schema twice yields the same result."""
-    with patch("configator.core._get_client", return_value=mock_op_client):
-        mock_op_client.vaults.list.return_value = [mock_vault]
-        mock_op_client.items.list.return_value = [mock_item_overview]
-        mock_op_client.items.get.return_value = complex_item
-        mock_op_client.secrets.resolve.side_effect = lambda x: x
-
-        first = await load_config(
-            token="test_token", vault="TestVault", item="TestItem", schema=ComplexConfig
-        )
-        second = await load_config(
-            token="test_token", vault="TestVault", item="TestItem", schema=ComplexConfig
-        )
+    """Test that loading complex schema twice yields the same result.
+
+    Repeated loads should only fetch the item itself again, not the vault and item overviews.
+    """
+    mock_op_client.vaults.list.return_value = [mock_vault]
+    mock_op_client.items.list.return_value = [mock_item_overview]
+    mock_op_client.items.get.return_value = complex_item
+    mock_op_client.secrets.resolve.side_effect = lambda x: x
+
+    first = await load_config(
+        token="test_token", vault="TestVault", item="TestItem", schema=ComplexConfig
+    )
+    second = await load_config(
+        token="test_token", vault="TestVault", item="TestItem", schema=ComplexConfig
+    )
 
-        assert first == second
+    assert first == second
+    assert mock_op_client.vaults.list.call_count == 1
+    assert mock_op_client.items.list.call_count == 1
+    assert mock_op_client.items.get.call_count == 2
@@ -7,12 +7,14 @@ from decimal import Decimal
 from os import getenv
 
 from pydantic import BaseModel
-from pytest import approx, mark
+from pytest import approx, fixture, skip
 
 from configator.core import load_config
 from configator.models import SentryConfig
 
 OP_TOKEN = getenv("OP_TOKEN")
+if OP_TOKEN is None:
+    skip("no 1Password token provided", allow_module_level=True)
 
 
 class ValuesConfig(BaseModel):
@@ -39,10 +41,10 @@ class E2ETestConfig(BaseModel):
     not_set: str = "default_value"
 
 
-@mark.skipif(OP_TOKEN is None, reason="no 1Password token provided")
-@mark.asyncio
-async def test_load_config():
-    expected_config = E2ETestConfig(
+@fixture(scope="session")
+def expected_e2e_config():
+    """Configuration expected from the 1Password test item, validated once per session."""
+    return E2ETestConfig(
         VALUES=ValuesConfig(
             a_string="foo",
             an_integer=42,
@@ -65,13 +67,25 @@ async def test_load_config():
         not_set="default_value",
     )
 
-    actual_config: E2ETestConfig = await load_config(
+
+@fixture(scope="session")
+async def loaded_e2e_config():
+    """Configuration loaded from the 1Password test item, fetched once per session."""
+    return await load_config(
         schema=E2ETestConfig,
         token=OP_TOKEN,
         vault="REPO configator",
         item="configator-test-e2e",
     )
 
-    assert actual_config == expected_config
-    assert actual_config.MIXIN.traces_sample_rate == approx(0.0)
-    assert isinstance(actual_config.VALUES.a_decimal, Decimal)
+
+def test_load_config(loaded_e2e_config, expected_e2e_config):
+    assert loaded_e2e_config == expected_e2e_config
+
+
+def test_load_config_mixin_default(loaded_e2e_config):
+    assert loaded_e2e_config.MIXIN.traces_sample_rate == approx(0.0)
+
+
+def test_load_config_decimal_type(loaded_e2e_config):
+    assert isinstance(loaded_e2e_config.VALUES.a_decimal, Decimal)